@@ -3,12 +3,14 @@ AI-Based Career Recommendation & Skill Gap Analysis System
 Main application file using Streamlit for the web interface
 """
 
+import functools
+from pathlib import Path
+from types import MappingProxyType
+import ahocorasick
 import streamlit as st
-import pandas as pd
+from rapidfuzz import fuzz, process
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from typing import List, Dict, Tuple
+from typing import Callable, FrozenSet, Iterable, Iterator, List, Dict, Tuple
 
 # Set page config
 st.set_page_config(
@@ -91,104 +93,344 @@ CAREER_DATABASE = {
     }
 }
 
+# Curated learning resources for common skills, shared by every learning path
+_SKILL_PRIORITY = MappingProxyType({
+    "Python": {"level": "Beginner-Intermediate", "resources": ("Python.org", "Real Python", "Codecademy"), "time": "2-3 months"},
+    "Machine Learning": {"level": "Intermediate-Advanced", "resources": ("Coursera ML Course", "Fast.ai", "Kaggle"), "time": "3-4 months"},
+    "SQL": {"level": "Beginner", "resources": ("SQLBolt", "Mode Analytics", "LeetCode"), "time": "1-2 months"},
+    "Cloud Computing": {"level": "Intermediate", "resources": ("AWS Training", "Cloud Academy", "A Cloud Guru"), "time": "2-3 months"},
+    "Data Visualization": {"level": "Beginner-Intermediate", "resources": ("Tableau Public", "DataCamp", "Storytelling with Data"), "time": "1-2 months"}
+})
+
+# Fitted TF-IDF model persisted next to this module; rebuilt whenever this
+# module or the installed sklearn version changes
+MODEL_CACHE_PATH = Path(__file__).with_name(".career_model.joblib")
+
+# Number of career recommendations shown per analysis
+TOP_N = 5
+
+# Minimum token_set_ratio for a user skill to count as a partial match
+PARTIAL_MATCH_THRESHOLD = 80
+
+# Welcome-screen career cards, rendered once as a single Markdown block each
+_CAREER_CARD_MD = {
+    name: f"**{name}**\n\n*{info['description'][:80]}...*\n\n*Growth: {info['growth']}*"
+    for name, info in CAREER_DATABASE.items()
+}
+
+def _normalize_skills(skills: Iterable[str]) -> FrozenSet[str]:
+    """Lowercase and strip skills into a set used for matching"""
+    return frozenset(s for s in (skill.lower().strip() for skill in skills) if s)
+
+# Characters that separate the words of a skill name
+_WORD_SEPARATORS = " /"
+
+def _skill_words(skill: str) -> str:
+    """Split slashed skills such as "html/css" into words for fuzzy scoring"""
+    return skill.replace("/", " ")
+
+def _pack_skill_ids(skill_ids: Iterable[int], vocab_size: int) -> np.ndarray:
+    """Bit-packed indicator vector of skill ids over the skill vocabulary"""
+    indicator = np.zeros(vocab_size, dtype=bool)
+    indicator[list(skill_ids)] = True
+    return np.packbits(indicator)
+
+def _match_all(user_bits: np.ndarray, career_bits: np.ndarray, vocab_size: int) -> np.ndarray:
+    """Exact skill matches of one user against every career at once
+    
+    career_bits holds one packed row per career. Returns the careers x vocab
+    boolean matrix of skills both required and held by the user.
+    """
+    return np.unpackbits(career_bits & user_bits, axis=1, count=vocab_size).astype(bool)
+
+def _segment_counts(mask: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Number of True entries in each offsets-delimited segment of a flat mask"""
+    cumulative = np.concatenate(([0], np.cumsum(mask)))
+    return cumulative[offsets[1:]] - cumulative[offsets[:-1]]
+
+def _make_gap_fn(required_skills: List[str], span: slice,
+                 index: int) -> Callable[[np.ndarray, np.ndarray], Dict]:
+    """Skill gap function specialized to one career of the frozen database
+    
+    The career's skills, its span in the flat match mask and its row in the
+    per-career counts are bound once, so each call only slices and builds
+    the result.
+    """
+    required_skills = tuple(required_skills)
+    total_required = len(required_skills)
+    
+    def gap_fn(matches: np.ndarray, counts: np.ndarray) -> Dict:
+        career_matches = matches[span]
+        total_matched = int(counts[index])
+        
+        # Calculate matched and missing skills
+        matched_skills = [skill for skill, matched in zip(required_skills, career_matches) if matched]
+        missing_skills = [skill for skill, matched in zip(required_skills, career_matches) if not matched]
+        
+        match_percentage = (total_matched / total_required) * 100 if total_required else 0
+        
+        return {
+            "matched_skills": matched_skills,
+            "missing_skills": missing_skills,
+            "match_percentage": match_percentage,
+            "total_required": total_required,
+            "total_matched": total_matched
+        }
+    
+    return gap_fn
+
+def _build_automaton(patterns: Iterable[str]) -> ahocorasick.Automaton:
+    """Aho-Corasick automaton over the given patterns, each stored as its own value"""
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+def _token_aligned_hits(automaton: ahocorasick.Automaton, text: str) -> Iterable[str]:
+    """Patterns found in text that start and end on word boundaries
+    
+    Spaces and slashes both count as boundaries, matching _skill_words. Such
+    a hit means one skill's words are a run of the other's, which
+    token_set_ratio would score 100 anyway.
+    """
+    for end, pattern in automaton.iter(text):
+        start = end - len(pattern) + 1
+        if ((start == 0 or text[start - 1] in _WORD_SEPARATORS)
+                and (end + 1 == len(text) or text[end + 1] in _WORD_SEPARATORS)):
+            yield pattern
+
+def _top_indices(scores: np.ndarray, top_n: int) -> np.ndarray:
+    """Indices of the top_n highest scores, best first"""
+    if top_n >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    idx = np.argpartition(-scores, top_n)[:top_n]
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
 class CareerRecommendationEngine:
     """AI-based career recommendation engine with skill gap analysis"""
     
     def __init__(self, career_database: Dict):
         self.career_database = career_database
-        self.vectorizer = TfidfVectorizer()
         self._build_model()
     
     def _build_model(self):
         """Build TF-IDF model for skill matching"""
+        # sklearn is imported here rather than at module level so it only
+        # loads once per process, when get_engine() first runs
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        
+        # Keep "+" and "#" inside terms like "C++" and "C#"; "/" and "." still
+        # separate words so "HTML/CSS" indexes both "html" and "css"
+        self.vectorizer = TfidfVectorizer(
+            sublinear_tf=True,
+            dtype=np.float32,
+            norm="l2",
+            lowercase=True,
+            token_pattern=r"[A-Za-z0-9+#]+"
+        )
+        
         career_texts = []
         for career, info in self.career_database.items():
             skills_text = " ".join(info["skills"])
             career_texts.append(skills_text)
         
-        self.skill_matrix = self.vectorizer.fit_transform(career_texts)
-        self.career_names = list(self.career_database.keys())
+        if not self._load_model(career_texts):
+            self.skill_matrix = self.vectorizer.fit_transform(career_texts)
+            self.career_names = list(self.career_database.keys())
+            self._save_model(career_texts)
+        
+        # Column-major copy for per-term lookups such as skills_to_careers
+        self.skill_matrix_csc = self.skill_matrix.tocsc()
+        
+        # Dense copy used for ranking; at this corpus size one BLAS gemv beats sparse dispatch
+        self.skill_matrix_dense = self.skill_matrix.toarray().astype(np.float32)
+        
+        # Vocabulary of whole skill names shared by all careers
+        self.vocab_names = np.array(sorted({skill.lower().strip() for info in self.career_database.values()
+                                            for skill in info["skills"]}))
+        self.vocab_id = {skill: i for i, skill in enumerate(self.vocab_names)}
+        self._vocab_automaton = _build_automaton(self.vocab_names) if len(self.vocab_names) else None
+        
+        # The required skill ids of all careers are concatenated into one flat
+        # array; each career owns the span between consecutive offsets and
+        # gets a gap function specialized to that span.
+        self._gap_fns = {}
+        required_ids = []
+        offsets = [0]
+        career_bits = []
+        for index, (career, info) in enumerate(self.career_database.items()):
+            orig = list(dict.fromkeys(info["skills"]))
+            career_ids = [self.vocab_id[s.lower().strip()] for s in orig]
+            required_ids.extend(career_ids)
+            offsets.append(len(required_ids))
+            career_bits.append(_pack_skill_ids(career_ids, len(self.vocab_names)))
+            self._gap_fns[career] = _make_gap_fn(orig, slice(offsets[-2], offsets[-1]), index)
+        self._required_ids = np.array(required_ids, dtype=np.int32)
+        self._required_offsets = np.array(offsets, dtype=np.int32)
+        self._required_rows = np.repeat(np.arange(len(career_bits)), np.diff(self._required_offsets))
+        # Careers x vocab bitmap of required skills, packed eight skills per byte
+        self.career_bits = np.vstack(career_bits)
+    
+    def _load_model(self, career_texts: List[str]) -> bool:
+        """Load the fitted TF-IDF model from MODEL_CACHE_PATH if it is still valid"""
+        import joblib
+        import sklearn
+        
+        try:
+            if MODEL_CACHE_PATH.stat().st_mtime <= Path(__file__).stat().st_mtime:
+                return False
+            (sklearn_version, cached_texts, vectorizer, skill_matrix,
+             career_names) = joblib.load(MODEL_CACHE_PATH)
+        except Exception:
+            # Missing, stale or unreadable cache: fall back to fitting
+            return False
+        
+        if (sklearn_version != sklearn.__version__ or cached_texts != career_texts
+                or career_names != list(self.career_database.keys())):
+            return False
+        
+        self.vectorizer = vectorizer
+        self.skill_matrix = skill_matrix
+        self.career_names = career_names
+        return True
+    
+    def _save_model(self, career_texts: List[str]):
+        """Persist the fitted TF-IDF model to MODEL_CACHE_PATH"""
+        import joblib
+        import sklearn
+        
+        try:
+            joblib.dump((sklearn.__version__, career_texts, self.vectorizer, self.skill_matrix,
+                         self.career_names), MODEL_CACHE_PATH, compress=3)
+        except OSError:
+            # Read-only deployments simply refit on the next cold start
+            pass
     
     def analyze_skill_gap(self, user_skills: List[str], target_career: str) -> Dict:
         """Analyze gap between user skills and target career requirements"""
-        if target_career not in self.career_database:
-            return {}
-        
-        required_skills = set(self.career_database[target_career]["skills"])
-        user_skills_set = set([s.lower().strip() for s in user_skills])
-        required_skills_lower = set([s.lower() for s in required_skills])
+        matches, counts = self._batch_skill_gaps(_normalize_skills(user_skills))
+        return self._gap_analysis(matches, counts, target_career)
+    
+    def _user_skill_bits(self, user_skills_set: FrozenSet[str]) -> np.ndarray:
+        """Packed bitmap of the user skills that exactly name a required skill"""
+        return _pack_skill_ids([self.vocab_id[s] for s in user_skills_set if s in self.vocab_id],
+                               len(self.vocab_names))
+    
+    def _batch_skill_gaps(self, user_skills_set: FrozenSet[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Match the user skills against every career at once
         
-        # Calculate matched and missing skills
-        matched_skills = []
-        missing_skills = []
+        Returns the flat matched mask aligned with _required_ids and the
+        matched count per career.
+        """
+        hits = _match_all(self._user_skill_bits(user_skills_set), self.career_bits, len(self.vocab_names))
+        matches = hits[self._required_rows, self._required_ids]
         
-        for skill in required_skills:
-            skill_lower = skill.lower()
-            if skill_lower in user_skills_set:
-                matched_skills.append(skill)
-            else:
-                # Check for partial matches
-                matched = False
-                for user_skill in user_skills_set:
-                    if user_skill in skill_lower or skill_lower in user_skill:
-                        matched_skills.append(skill)
-                        matched = True
-                        break
-                if not matched:
-                    missing_skills.append(skill)
-        
-        match_percentage = (len(matched_skills) / len(required_skills)) * 100 if required_skills else 0
+        # Partial matches only depend on the skill itself, so score each
+        # distinct unmatched skill once across all careers
+        residual = np.flatnonzero(~matches)
+        if len(residual) and user_skills_set:
+            residual_ids = np.unique(self._required_ids[residual])
+            partial = self._contained_skills(user_skills_set, residual_ids)
+            
+            # Fuzzy scoring only for what plain word containment did not settle
+            fuzzy_ids = residual_ids[~partial]
+            if len(fuzzy_ids):
+                scores = process.cdist(self.vocab_names[fuzzy_ids].tolist(), list(user_skills_set),
+                                       scorer=fuzz.token_set_ratio, processor=_skill_words)
+                partial[~partial] = scores.max(axis=1) >= PARTIAL_MATCH_THRESHOLD
+            
+            matches[residual] = np.isin(self._required_ids[residual], residual_ids[partial])
         
-        return {
-            "matched_skills": matched_skills,
-            "missing_skills": missing_skills,
-            "match_percentage": match_percentage,
-            "total_required": len(required_skills),
-            "total_matched": len(matched_skills)
-        }
+        return matches, _segment_counts(matches, self._required_offsets)
     
-    def recommend_careers(self, user_skills: List[str], top_n: int = 5) -> List[Tuple[str, float, Dict]]:
-        """Recommend careers based on user skills using cosine similarity"""
-        user_skills_text = " ".join(user_skills)
-        user_vector = self.vectorizer.transform([user_skills_text])
+    def _contained_skills(self, user_skills_set: FrozenSet[str], skill_ids: np.ndarray) -> np.ndarray:
+        """Mask of the given required skills whose words contain, or are contained in, a user skill"""
+        # Required skills inside a user skill, e.g. "python" in "advanced python"
+        contained = set()
+        if self._vocab_automaton is not None:
+            for user_skill in user_skills_set:
+                contained.update(self.vocab_id[name] for name in _token_aligned_hits(self._vocab_automaton, user_skill))
+        partial = np.isin(skill_ids, list(contained))
+        
+        # User skills inside a required skill, e.g. "power bi" in "power bi tools"
+        user_automaton = _build_automaton(user_skills_set)
+        for i in np.flatnonzero(~partial):
+            partial[i] = next(_token_aligned_hits(user_automaton, self.vocab_names[skill_ids[i]]), None) is not None
         
-        # Calculate similarity scores
-        similarities = cosine_similarity(user_vector, self.skill_matrix)[0]
+        return partial
+    
+    def _gap_analysis(self, matches: np.ndarray, counts: np.ndarray, target_career: str) -> Dict:
+        """Slice one career's skill gap out of the batched match results"""
+        gap_fn = self._gap_fns.get(target_career)
+        if gap_fn is None:
+            return {}
+        return gap_fn(matches, counts)
+    
+    def recommend_careers(self, user_skills: List[str],
+                          top_n: int = TOP_N) -> Iterator[Tuple[str, float, Dict, Dict]]:
+        """Recommend careers based on user skills using cosine similarity
         
-        # Get top recommendations
-        top_indices = np.argsort(similarities)[::-1][:top_n]
+        Yields recommendations best first, building each gap analysis only
+        when the caller asks for the next one.
+        """
+        skills_key = tuple(sorted(_normalize_skills(user_skills)))
+        top_indices, similarities, matches, counts = self._rank_and_match(skills_key, top_n)
         
-        recommendations = []
         for idx in top_indices:
             career_name = self.career_names[idx]
             similarity_score = similarities[idx] * 100
-            gap_analysis = self.analyze_skill_gap(user_skills, career_name)
+            gap_analysis = self._gap_analysis(matches, counts, career_name)
             
-            recommendations.append((
+            yield (
                 career_name,
                 similarity_score,
                 gap_analysis,
                 self.career_database[career_name]
-            ))
+            )
+    
+    @functools.lru_cache(maxsize=256)
+    def _rank_and_match(self, skills_key: Tuple[str, ...],
+                        top_n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Memoized ranking and batched skill matching keyed on the sorted, normalized user skills"""
+        user_skills_text = " ".join(skills_key)
+        user_vector = self.vectorizer.transform([user_skills_text])
         
-        return recommendations
+        # TF-IDF rows are already L2-normalized, so the dot product is the cosine similarity
+        user_dense = user_vector.toarray().ravel().astype(np.float32)
+        similarities = self.skill_matrix_dense @ user_dense
+        
+        # Get top recommendations without fully sorting every score
+        top_indices = _top_indices(similarities, top_n)
+        
+        # Skill gaps for every career in a single batch, sliced per recommendation
+        matches, counts = self._batch_skill_gaps(frozenset(skills_key))
+        
+        return top_indices, similarities, matches, counts
+    
+    def skills_to_careers(self, skill: str) -> List[str]:
+        """List the careers whose required skills mention every term of a skill"""
+        terms = self.vectorizer.build_analyzer()(skill)
+        vocab = self.vectorizer.vocabulary_
+        if not terms or any(term not in vocab for term in terms):
+            return []
+        
+        rows = None
+        for term in terms:
+            column = self.skill_matrix_csc[:, vocab[term]]
+            rows = set(column.indices) if rows is None else rows & set(column.indices)
+        
+        return [name for i, name in enumerate(self.career_names) if i in rows]
     
     def get_learning_path(self, missing_skills: List[str], career: str) -> Dict:
         """Generate learning path recommendations for missing skills"""
-        skill_priority = {
-            "Python": {"level": "Beginner-Intermediate", "resources": ["Python.org", "Real Python", "Codecademy"], "time": "2-3 months"},
-            "Machine Learning": {"level": "Intermediate-Advanced", "resources": ["Coursera ML Course", "Fast.ai", "Kaggle"], "time": "3-4 months"},
-            "SQL": {"level": "Beginner", "resources": ["SQLBolt", "Mode Analytics", "LeetCode"], "time": "1-2 months"},
-            "Cloud Computing": {"level": "Intermediate", "resources": ["AWS Training", "Cloud Academy", "A Cloud Guru"], "time": "2-3 months"},
-            "Data Visualization": {"level": "Beginner-Intermediate", "resources": ["Tableau Public", "DataCamp", "Storytelling with Data"], "time": "1-2 months"}
-        }
-        
         learning_path = []
         for skill in missing_skills:
-            if skill in skill_priority:
+            entry = _SKILL_PRIORITY.get(skill)
+            if entry:
                 learning_path.append({
                     "skill": skill,
-                    **skill_priority[skill]
+                    **entry
                 })
             else:
                 learning_path.append({
@@ -204,15 +446,16 @@ class CareerRecommendationEngine:
             "estimated_time": f"{len(missing_skills) * 2}-{len(missing_skills) * 3} months"
         }
 
+@st.cache_resource
+def get_engine() -> CareerRecommendationEngine:
+    """Shared recommendation engine, fitted once per process"""
+    return CareerRecommendationEngine(CAREER_DATABASE)
+
 def main():
     st.title("🚀 AI-Based Career Recommendation & Skill Gap Analysis System")
     st.markdown("### Discover your ideal career path and identify skills to develop")
     
-    # Initialize session state
-    if 'recommendations' not in st.session_state:
-        st.session_state.recommendations = None
-    if 'engine' not in st.session_state:
-        st.session_state.engine = CareerRecommendationEngine(CAREER_DATABASE)
+    engine = get_engine()
     
     # Sidebar for user input
     with st.sidebar:
@@ -242,77 +485,85 @@ def main():
         st.markdown("**Or select from common skills:**")
         common_skills = ["Python", "Java", "JavaScript", "SQL", "Machine Learning", "AWS", "Docker", "Git", "Communication", "Leadership"]
         selected_common = st.multiselect("Common Skills", common_skills)
-        user_skills = list(set(user_skills + selected_common))
+        # Deduplicate while keeping the order the skills were entered in
+        user_skills = list(dict.fromkeys(s.strip() for s in user_skills + selected_common if s.strip()))
         
         st.markdown("---")
         analyze_button = st.button("🔍 Analyze Career Options", type="primary", use_container_width=True)
     
     # Main content area
     if analyze_button and user_skills:
-        with st.spinner("Analyzing your profile and generating recommendations..."):
-            recommendations = st.session_state.engine.recommend_careers(user_skills, top_n=5)
-            st.session_state.recommendations = recommendations
+        # Slots filled in ranked order as each recommendation is produced
+        status = st.empty()
+        heading = st.empty()
+        placeholders = [st.empty() for _ in range(TOP_N)]
+        found = 0
         
-        if st.session_state.recommendations:
-            st.success(f"Found {len(st.session_state.recommendations)} career matches for you!")
-            
-            # Display recommendations
-            st.header("🎯 Recommended Careers")
-            
-            for idx, (career_name, score, gap_analysis, career_info) in enumerate(st.session_state.recommendations, 1):
-                with st.expander(f"#{idx} {career_name} - {score:.1f}% Match", expanded=(idx == 1)):
-                    col1, col2 = st.columns([2, 1])
-                    
-                    with col1:
-                        st.markdown(f"**Description:** {career_info['description']}")
-                        st.markdown(f"**Salary Range:** {career_info['salary_range']}")
-                        st.markdown(f"**Growth Potential:** {career_info['growth']}")
-                        st.markdown(f"**Experience Level:** {career_info['experience_level']}")
-                    
-                    with col2:
-                        # Progress bar for match percentage
-                        st.metric("Match Score", f"{gap_analysis['match_percentage']:.1f}%")
-                        progress_value = gap_analysis['match_percentage'] / 100
-                        st.progress(progress_value)
-                    
-                    # Skill gap analysis
-                    st.markdown("#### 📊 Skill Gap Analysis")
-                    
-                    col3, col4 = st.columns(2)
-                    
-                    with col3:
-                        st.markdown("**✅ Matched Skills**")
-                        if gap_analysis['matched_skills']:
-                            for skill in gap_analysis['matched_skills']:
-                                st.success(f"✓ {skill}")
-                        else:
-                            st.info("No skills matched yet")
-                    
-                    with col4:
-                        st.markdown("**❌ Missing Skills**")
+        with st.spinner("Analyzing your profile and generating recommendations..."):
+            recommendations = engine.recommend_careers(user_skills, top_n=TOP_N)
+            for idx, (career_name, score, gap_analysis, career_info) in enumerate(recommendations, 1):
+                if idx == 1:
+                    # Display recommendations
+                    heading.header("🎯 Recommended Careers")
+                found = idx
+                
+                with placeholders[idx - 1].container():
+                    with st.expander(f"#{idx} {career_name} - {score:.1f}% Match", expanded=(idx == 1)):
+                        col1, col2 = st.columns([2, 1])
+                        
+                        with col1:
+                            st.markdown(f"**Description:** {career_info['description']}")
+                            st.markdown(f"**Salary Range:** {career_info['salary_range']}")
+                            st.markdown(f"**Growth Potential:** {career_info['growth']}")
+                            st.markdown(f"**Experience Level:** {career_info['experience_level']}")
+                        
+                        with col2:
+                            # Progress bar for match percentage
+                            st.metric("Match Score", f"{gap_analysis['match_percentage']:.1f}%")
+                            progress_value = gap_analysis['match_percentage'] / 100
+                            st.progress(progress_value)
+                        
+                        # Skill gap analysis
+                        st.markdown("#### 📊 Skill Gap Analysis")
+                        
+                        col3, col4 = st.columns(2)
+                        
+                        with col3:
+                            st.markdown("**✅ Matched Skills**")
+                            if gap_analysis['matched_skills']:
+                                for skill in gap_analysis['matched_skills']:
+                                    st.success(f"✓ {skill}")
+                            else:
+                                st.info("No skills matched yet")
+                        
+                        with col4:
+                            st.markdown("**❌ Missing Skills**")
+                            if gap_analysis['missing_skills']:
+                                for skill in gap_analysis['missing_skills']:
+                                    st.error(f"✗ {skill}")
+                            else:
+                                st.success("All required skills matched!")
+                        
+                        # Learning path
                         if gap_analysis['missing_skills']:
-                            for skill in gap_analysis['missing_skills']:
-                                st.error(f"✗ {skill}")
-                        else:
-                            st.success("All required skills matched!")
-                    
-                    # Learning path
-                    if gap_analysis['missing_skills']:
-                        st.markdown("#### 📚 Recommended Learning Path")
-                        learning_path = st.session_state.engine.get_learning_path(
-                            gap_analysis['missing_skills'],
-                            career_name
-                        )
+                            st.markdown("#### 📚 Recommended Learning Path")
+                            learning_path = engine.get_learning_path(
+                                gap_analysis['missing_skills'],
+                                career_name
+                            )
+                            
+                            for skill_info in learning_path['skills_to_learn'][:5]:  # Show top 5
+                                with st.expander(f"Learn: {skill_info['skill']}"):
+                                    st.markdown(f"**Level:** {skill_info.get('level', 'Intermediate')}")
+                                    st.markdown(f"**Time Required:** {skill_info.get('time', '2-3 months')}")
+                                    st.markdown("**Resources:**")
+                                    for resource in skill_info.get('resources', []):
+                                        st.markdown(f"- {resource}")
                         
-                        for skill_info in learning_path['skills_to_learn'][:5]:  # Show top 5
-                            with st.expander(f"Learn: {skill_info['skill']}"):
-                                st.markdown(f"**Level:** {skill_info.get('level', 'Intermediate')}")
-                                st.markdown(f"**Time Required:** {skill_info.get('time', '2-3 months')}")
-                                st.markdown("**Resources:**")
-                                for resource in skill_info.get('resources', []):
-                                    st.markdown(f"- {resource}")
-                    
-                    st.markdown("---")
+                        st.markdown("---")
+        
+        if found:
+            status.success(f"Found {found} career matches for you!")
     
     elif analyze_button and not user_skills:
         st.warning("⚠️ Please enter at least one skill to get career recommendations.")
@@ -345,15 +596,11 @@ def main():
         # Display sample careers
         st.markdown("### 💼 Available Career Profiles")
         career_cols = st.columns(3)
-        careers_list = list(CAREER_DATABASE.keys())
         
-        for idx, career in enumerate(careers_list):
+        for idx, card_md in enumerate(_CAREER_CARD_MD.values()):
             col_idx = idx % 3
             with career_cols[col_idx]:
-                with st.container():
-                    st.markdown(f"**{career}**")
-                    st.caption(CAREER_DATABASE[career]['description'][:80] + "...")
-                    st.markdown(f"*Growth: {CAREER_DATABASE[career]['growth']}*")
+                st.markdown(card_md)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
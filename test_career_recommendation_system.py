@@ -0,0 +1,81 @@
+"""
+Tests for the skill matching rules of the career recommendation engine
+"""
+
+import numpy as np
+import pytest
+
+from career_recommendation_system import CAREER_DATABASE, CareerRecommendationEngine
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return CareerRecommendationEngine(CAREER_DATABASE)
+
+
+def test_exact_match_ignores_case(engine):
+    gap = engine.analyze_skill_gap(["sql", "EXCEL"], "Business Analyst")
+    assert gap["matched_skills"] == ["SQL", "Excel"]
+    assert gap["total_matched"] == 2
+
+
+def test_java_does_not_match_javascript(engine):
+    gap = engine.analyze_skill_gap(["java"], "Software Engineer")
+    assert gap["matched_skills"] == ["Java"]
+    assert "JavaScript" in gap["missing_skills"]
+
+
+def test_data_does_not_match_databases(engine):
+    gap = engine.analyze_skill_gap(["data"], "Software Engineer")
+    assert "Databases" in gap["missing_skills"]
+
+
+def test_required_skill_inside_user_skill_matches(engine):
+    gap = engine.analyze_skill_gap(["advanced python"], "Data Scientist")
+    assert "Python" in gap["matched_skills"]
+
+
+def test_part_of_slashed_skill_matches(engine):
+    gap = engine.analyze_skill_gap(["html"], "UX Designer")
+    assert "HTML/CSS" in gap["matched_skills"]
+
+
+@pytest.mark.parametrize("skills, expected", [
+    (["CSS"], "UX Designer"),
+    (["HTML", "CSS"], "UX Designer"),
+    (["CI"], "DevOps Engineer"),
+])
+def test_parts_of_skills_rank_their_career_first(engine, skills, expected):
+    career_name, score, _, _ = next(engine.recommend_careers(skills, top_n=1))
+    assert career_name == expected
+    assert score > 0
+
+
+def test_trailing_punctuation_is_not_part_of_a_term(engine):
+    career_name, score, _, _ = next(engine.recommend_careers(["Python."], top_n=1))
+    assert "Python" in CAREER_DATABASE[career_name]["skills"]
+    assert score > 0
+
+
+def test_learning_paths_do_not_share_resource_lists(engine):
+    first = engine.get_learning_path(["Python"], "Data Scientist")
+    second = engine.get_learning_path(["Python"], "AI Engineer")
+    with pytest.raises(AttributeError):
+        first["skills_to_learn"][0]["resources"].append("Extra")
+    assert second["skills_to_learn"][0]["resources"] == ("Python.org", "Real Python", "Codecademy")
+
+
+@pytest.mark.parametrize("user_skill, required_skill", [
+    ("html", "html/css"),
+    ("ci", "ci/cd"),
+    ("advanced python", "python"),
+    ("power bi tools", "power bi"),
+])
+def test_word_containment_is_settled_before_fuzzy_scoring(engine, user_skill, required_skill):
+    skill_ids = np.array([engine.vocab_id[required_skill]])
+    assert engine._contained_skills(frozenset({user_skill}), skill_ids).all()
+
+
+def test_partial_word_is_not_containment(engine):
+    skill_ids = np.array([engine.vocab_id["javascript"]])
+    assert not engine._contained_skills(frozenset({"java"}), skill_ids).any()